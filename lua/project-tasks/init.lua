@@ -612,6 +612,30 @@ function M.get_targets(ctx)
 	return nil
 end
 
+--- Register a callback for when a task finishes (quickfix mode only)
+--- Thin wrapper around the User ProjectTaskExited autocmd.
+---@param task string|nil Task name to react to (nil = any task)
+---@param callback function Called with the event data plus `ok` (exit 0 and not cancelled)
+---@param opts table|nil { once = bool }
+---@return integer id Autocmd id (remove with nvim_del_autocmd)
+function M.on_task_complete(task, callback, opts)
+	opts = opts or {}
+	return vim.api.nvim_create_autocmd("User", {
+		pattern = "ProjectTaskExited",
+		desc = "project-tasks: on_task_complete",
+		callback = function(args)
+			local data = args.data or {}
+			if task and data.task ~= task then
+				return
+			end
+			callback(vim.tbl_extend("force", data, { ok = data.code == 0 and not data.cancelled }))
+			-- Returning true deletes the autocmd; done here (not via `once`) so
+			-- exits of other tasks don't consume it.
+			return opts.once == true
+		end,
+	})
+end
+
 --- Setup default keymaps
 function M.setup_keymaps()
 	local prefix = M.config.keymap_prefix
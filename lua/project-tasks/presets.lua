@@ -5,6 +5,10 @@ local M = {}
 -- Cache for loaded presets data
 M._cache = {}
 
+-- CMake File API locations, relative to the build directory
+local FILE_API_REPLY_SUBDIR = "/.cmake/api/v1/reply"
+local FILE_API_QUERY_SUBDIR = "/.cmake/api/v1/query/client-project-tasks"
+
 --- Load and merge CMakePresets.json + CMakeUserPresets.json
 ---@param root string Project root path
 ---@return table|nil presets List of configure presets
@@ -119,13 +123,21 @@ end
 ---@param path string
 ---@return table|nil
 function M.read_presets_file(path)
-	local stat = vim.uv.fs_stat(path)
-	if not stat then
+	-- Opening directly doubles as the existence check (no separate stat)
+	local f = io.open(path, "rb")
+	if not f then
 		return nil
 	end
+	local content = f:read("*a")
+	f:close()
 
-	local content = vim.fn.readfile(path)
-	local ok, data = pcall(vim.json.decode, table.concat(content, "\n"))
+	-- CMake accepts presets files with a UTF-8 BOM (written by Visual Studio);
+	-- vim.json.decode does not
+	if content:sub(1, 3) == "\239\187\191" then
+		content = content:sub(4)
+	end
+
+	local ok, data = pcall(vim.json.decode, content)
 	if not ok then
 		vim.notify("[project-tasks] Failed to parse: " .. path, vim.log.levels.WARN)
 		return nil
@@ -229,7 +241,7 @@ function M.get_targets(root, binary_dir)
 		binary_dir = root .. "/" .. binary_dir
 	end
 
-	local reply_dir = binary_dir .. "/.cmake/api/v1/reply"
+	local reply_dir = binary_dir .. FILE_API_REPLY_SUBDIR
 	local index_path = M.find_reply_index(reply_dir)
 
 	if not index_path then
@@ -383,9 +395,14 @@ function M.parse_target(path, reply_dir)
 		-- Make absolute if needed
 		if artifact_path and not artifact_path:match("^/") then
 			-- Path is relative to build directory
-			-- reply_dir is <build_dir>/.cmake/api/v1/reply
-			-- Go up 4 levels: reply -> v1 -> api -> .cmake -> build_dir
-			local build_dir = vim.fn.fnamemodify(reply_dir, ":h:h:h:h")
+			-- reply_dir is <build_dir>/.cmake/api/v1/reply, so strip that suffix
+			local build_dir
+			if vim.endswith(reply_dir, FILE_API_REPLY_SUBDIR) then
+				build_dir = reply_dir:sub(1, -#FILE_API_REPLY_SUBDIR - 1)
+			else
+				-- Go up 4 levels: reply -> v1 -> api -> .cmake -> build_dir
+				build_dir = vim.fn.fnamemodify(reply_dir, ":h:h:h:h")
+			end
 			artifact_path = build_dir .. "/" .. artifact_path
 		end
 	end
@@ -400,7 +417,7 @@ end
 --- Setup CMake File API query files
 ---@param binary_dir string
 function M.setup_query(binary_dir)
-	local query_dir = binary_dir .. "/.cmake/api/v1/query/client-project-tasks"
+	local query_dir = binary_dir .. FILE_API_QUERY_SUBDIR
 
 	-- Try to create directory (may fail on read-only paths)
 	local ok = pcall(function()
@@ -411,12 +428,15 @@ function M.setup_query(binary_dir)
 		return
 	end
 
-	-- Create query files (empty files trigger the queries)
+	-- Create query files (empty files trigger the queries); existing ones are left alone
 	local queries = { "codemodel-v2", "cache-v2", "toolchains-v1" }
 	for _, q in ipairs(queries) do
-		local f = io.open(query_dir .. "/" .. q, "w")
-		if f then
-			f:close()
+		local path = query_dir .. "/" .. q
+		if not vim.uv.fs_stat(path) then
+			local f = io.open(path, "w")
+			if f then
+				f:close()
+			end
 		end
 	end
 end
@@ -455,7 +475,7 @@ end
 ---@param binary_dir string
 ---@return string|nil
 function M.find_latest_cache_reply(binary_dir)
-	local reply_dir = binary_dir .. "/.cmake/api/v1/reply"
+	local reply_dir = binary_dir .. FILE_API_REPLY_SUBDIR
 	local stat = vim.uv.fs_stat(reply_dir)
 	if not stat then
 		return nil
@@ -585,11 +605,10 @@ local function ensure_symlink(link, target, marker_path)
 end
 
 local function copy_file(src, dst)
-	local data = read_file(src)
-	if not data then
-		return false
-	end
-	return write_file(dst, data)
+	-- Let libuv copy in the kernel; ficlone uses a copy-on-write clone where the
+	-- filesystem supports it and silently falls back to a regular copy otherwise.
+	local ok, result = pcall(vim.uv.fs_copyfile, src, dst, { ficlone = true })
+	return ok and result == true
 end
 
 local function ensure_copy(link, target, marker_path)
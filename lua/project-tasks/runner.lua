@@ -11,8 +11,14 @@ M.current_job = nil
 M.current_job_pid = nil
 M.job_cancelled = false
 
--- Timer for watching CMake configure/generate completion
+-- Timer (and fs event watcher, where available) for watching CMake configure/generate completion
 M.cmake_config_timer = nil
+M.cmake_config_watcher = nil
+
+-- Configure watcher polling: backoff bounds and overall watch duration (ms)
+local CMAKE_CONFIG_POLL_MIN_MS = 50
+local CMAKE_CONFIG_POLL_MAX_MS = 500
+local CMAKE_CONFIG_WATCH_MS = 60000
 
 --- Expand ${var} placeholders in a string
 ---@param str string
@@ -103,12 +109,33 @@ function M.is_cmake_configured(root, binary_dir)
 	return configured
 end
 
+--- Fire a task lifecycle event (User autocmd, e.g. ProjectTaskStarted)
+---@param pattern string
+---@param ctx table
+---@param data table|nil Extra fields merged into the event data
+local function emit_task_event(pattern, ctx, data)
+	vim.api.nvim_exec_autocmds("User", {
+		pattern = pattern,
+		modeline = false,
+		data = vim.tbl_extend("force", {
+			task = ctx.task,
+			backend = ctx.backend,
+			root = ctx.root,
+		}, data or {}),
+	})
+end
+
 local function stop_cmake_config_timer()
 	if M.cmake_config_timer then
 		M.cmake_config_timer:stop()
 		M.cmake_config_timer:close()
 		M.cmake_config_timer = nil
 	end
+	if M.cmake_config_watcher then
+		M.cmake_config_watcher:stop()
+		M.cmake_config_watcher:close()
+		M.cmake_config_watcher = nil
+	end
 end
 
 local function should_watch_cmake_config(ctx)
@@ -132,38 +159,71 @@ local function start_cmake_config_timer(ctx)
 		return
 	end
 
-	local checks = 0
-	local max_checks = 120 -- ~60s
-	local timer = vim.uv.new_timer()
-	timer:start(500, 500, vim.schedule_wrap(function()
-		checks = checks + 1
-		if checks > max_checks then
-			stop_cmake_config_timer()
-			return
-		end
-
-		local build_dir = binary_dir
-		if not vim.startswith(build_dir, "/") then
-			build_dir = root .. "/" .. build_dir
-		end
+	local build_dir = binary_dir
+	if not vim.startswith(build_dir, "/") then
+		build_dir = root .. "/" .. build_dir
+	end
 
+	--- Check configure progress; returns true once there is nothing left to wait for
+	local function check()
 		-- Wait for the build directory to be configured (CMakeCache created)
-		local cache_path = build_dir .. "/CMakeCache.txt"
-		if not vim.uv.fs_stat(cache_path) then
-			return
+		if not vim.uv.fs_stat(build_dir .. "/CMakeCache.txt") then
+			return false
 		end
 
 		-- If export isn't enabled, stop watching
 		if not presets.is_compile_commands_exported(root, binary_dir) then
-			stop_cmake_config_timer()
-			return
+			return true
 		end
 
 		if vim.uv.fs_stat(build_dir .. "/compile_commands.json") then
 			presets.sync_compile_commands_link(root, binary_dir)
+			return true
+		end
+		return false
+	end
+
+	-- Poll with exponential backoff: fast configures are picked up quickly,
+	-- slow ones settle at one check per CMAKE_CONFIG_POLL_MAX_MS.
+	local delay = CMAKE_CONFIG_POLL_MIN_MS
+	local deadline = vim.uv.now() + CMAKE_CONFIG_WATCH_MS
+
+	-- If the build dir already exists, get notified when CMake writes the files we
+	-- care about; polling then only acts as a slow safety net.
+	local watcher = vim.uv.fs_stat(build_dir) and vim.uv.new_fs_event()
+	if watcher then
+		local started = watcher:start(build_dir, {}, vim.schedule_wrap(function(err, filename)
+			if M.cmake_config_watcher ~= watcher or err then
+				return
+			end
+			if filename == "CMakeCache.txt" or filename == "compile_commands.json" then
+				if check() then
+					stop_cmake_config_timer()
+				end
+			end
+		end))
+		if started then
+			M.cmake_config_watcher = watcher
+			delay = CMAKE_CONFIG_POLL_MAX_MS
+		else
+			watcher:close()
+		end
+	end
+
+	local timer = vim.uv.new_timer()
+	local function tick()
+		-- Watcher was stopped or replaced while this callback was scheduled
+		if M.cmake_config_timer ~= timer then
+			return
+		end
+		if check() or vim.uv.now() >= deadline then
 			stop_cmake_config_timer()
+			return
 		end
-	end))
+		delay = math.min(delay * 2, CMAKE_CONFIG_POLL_MAX_MS)
+		timer:start(delay, 0, vim.schedule_wrap(tick))
+	end
+	timer:start(delay, 0, vim.schedule_wrap(tick))
 	M.cmake_config_timer = timer
 end
 
@@ -207,6 +267,13 @@ function M.run(task, ctx, terminal_opts)
 		table.insert(cmd, 1, "open")
 	end
 
+	-- Request File API replies before configuring, so target discovery works
+	-- right after the first configure instead of needing a second one
+	if should_watch_cmake_config(ctx) then
+		local presets = require("project-tasks.presets")
+		presets.setup_query(presets.resolve_binary_dir(ctx.root, ctx.variables.binary_dir))
+	end
+
 	-- Check for dap integration
 	if task.use_dap then
 		local ok = M.try_dap(task, ctx, cmd)
@@ -317,6 +384,8 @@ function M.run_in_terminal(cmd, ctx, terminal_opts, focus)
 	-- Send command to terminal
 	vim.fn.chansend(vim.b[M.term_buf].terminal_job_id, full_cmd .. "\n")
 
+	emit_task_event("ProjectTaskStarted", ctx, { cmd = cmd, mode = "terminal" })
+
 	-- Focus terminal or return to previous window
 	if focus then
 		vim.api.nvim_set_current_win(M.term_win)
@@ -387,6 +456,8 @@ function M.run_to_quickfix(cmd, ctx, opts)
 		title = cmd_name .. " (running...)",
 		items = { { text = "$ " .. cmd_str }, { text = "" } },
 	})
+	-- Address this list by id so later updates never land in another quickfix list
+	local qf_id = vim.fn.getqflist({ id = 0 }).id
 	vim.cmd("copen")
 	vim.notify(("[project-tasks] Running: %s"):format(cmd_name), vim.log.levels.INFO)
 
@@ -395,6 +466,34 @@ function M.run_to_quickfix(cmd, ctx, opts)
 
 	-- Collect output lines for streaming to quickfix
 	local lines = {}
+	-- Number of collected lines already added to the quickfix list
+	local flushed = 0
+	--- Append collected-but-unflushed lines (plus optional trailer items) to the list.
+	--- Only new items are sent, so streaming cost stays linear in the output size.
+	---@param title string
+	---@param extra table|nil
+	local function flush_quickfix(title, extra)
+		local qf_items = {}
+		for i = flushed + 1, #lines do
+			table.insert(qf_items, { text = lines[i] })
+		end
+		flushed = #lines
+		for _, item in ipairs(extra or {}) do
+			table.insert(qf_items, item)
+		end
+		vim.fn.setqflist({}, "a", { id = qf_id, title = title, items = qf_items })
+		-- Scroll to bottom
+		vim.cmd("cbottom")
+	end
+
+	-- Only one quickfix refresh is queued at a time; chunks arriving before it
+	-- runs are picked up by that same refresh.
+	local refresh_pending = false
+	local function refresh_quickfix()
+		refresh_pending = false
+		flush_quickfix(cmd_name .. " (running...)")
+	end
+
 	local function append_output(err, data)
 		if err or not data then
 			return
@@ -406,15 +505,10 @@ function M.run_to_quickfix(cmd, ctx, opts)
 			end
 		end
 		-- Update quickfix with current output
-		vim.schedule(function()
-			local qf_items = { { text = "$ " .. cmd_str }, { text = "" } }
-			for _, l in ipairs(lines) do
-				table.insert(qf_items, { text = l })
-			end
-			vim.fn.setqflist({}, "r", { title = cmd_name .. " (running...)", items = qf_items })
-			-- Scroll to bottom
-			vim.cmd("cbottom")
-		end)
+		if not refresh_pending then
+			refresh_pending = true
+			vim.schedule(refresh_quickfix)
+		end
 	end
 
 	M.current_job = vim.system(cmd, {
@@ -436,30 +530,22 @@ function M.run_to_quickfix(cmd, ctx, opts)
 
 			-- Check if job was cancelled
 			if M.job_cancelled then
-				local qf_items = { { text = "$ " .. cmd_str }, { text = "" } }
-				for _, l in ipairs(lines) do
-					table.insert(qf_items, { text = l })
-				end
-				table.insert(qf_items, { text = "" })
-				table.insert(qf_items, { text = ("[✗ %s cancelled]"):format(cmd_name) })
-				vim.fn.setqflist({}, "r", { title = cmd_name .. " ✗", items = qf_items })
-				vim.cmd("cbottom")
+				flush_quickfix(cmd_name .. " ✗", {
+					{ text = "" },
+					{ text = ("[✗ %s cancelled]"):format(cmd_name) },
+				})
+				emit_task_event("ProjectTaskExited", ctx, { code = result.code, cancelled = true })
 				return
 			end
 
 			-- Final update with completion status
-			local qf_items = { { text = "$ " .. cmd_str }, { text = "" } }
-			for _, l in ipairs(lines) do
-				table.insert(qf_items, { text = l })
-			end
-
 			local status_icon = result.code == 0 and "✓" or "✗"
 			local status_text = result.code == 0 and "completed" or ("failed (exit %d)"):format(result.code)
-			table.insert(qf_items, { text = "" })
-			table.insert(qf_items, { text = ("[%s %s %s]"):format(status_icon, cmd_name, status_text) })
-
-			vim.fn.setqflist({}, "r", { title = cmd_name .. " " .. status_icon, items = qf_items })
-			vim.cmd("cbottom")
+			flush_quickfix(cmd_name .. " " .. status_icon, {
+				{ text = "" },
+				{ text = ("[%s %s %s]"):format(status_icon, cmd_name, status_text) },
+			})
+			emit_task_event("ProjectTaskExited", ctx, { code = result.code, cancelled = false })
 
 			if result.code == 0 then
 				vim.notify(("[project-tasks] ✓ %s completed"):format(cmd_name), vim.log.levels.INFO)
@@ -474,6 +560,8 @@ function M.run_to_quickfix(cmd, ctx, opts)
 
 	-- Store pid for cancellation (vim.system returns SystemObj with pid field)
 	M.current_job_pid = M.current_job.pid
+
+	emit_task_event("ProjectTaskStarted", ctx, { cmd = cmd, mode = "quickfix" })
 end
 
 --- Recursively get all descendant process IDs
@@ -493,6 +581,26 @@ local function get_all_descendants(pid)
 	return descendants
 end
 
+--- Check whether a task is currently running
+--- Quickfix jobs are tracked directly; in terminal modes a task counts as running
+--- while the terminal shell has child processes.
+---@return boolean
+function M.is_running()
+	if M.current_job then
+		return true
+	end
+
+	if M.term_buf and vim.api.nvim_buf_is_valid(M.term_buf) then
+		local ok, main_pid = pcall(vim.api.nvim_buf_get_var, M.term_buf, "terminal_job_pid")
+		if ok and main_pid then
+			local ok_children, children = pcall(vim.api.nvim_get_proc_children, main_pid)
+			return ok_children and #children > 0
+		end
+	end
+
+	return false
+end
+
 --- Cancel the currently running task
 function M.cancel()
 	-- Stop any pending configure watcher
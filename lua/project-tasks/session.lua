@@ -68,6 +68,10 @@ function M.set(root, key, value)
   if not data[root] then
     data[root] = {}
   end
+  -- Skip the disk write when nothing changed
+  if data[root][key] == value then
+    return
+  end
   data[root][key] = value
   M.save()
 end
@@ -107,6 +111,11 @@ function M.set_build_target(root, scope, value, signature)
     data[root].build_targets = {}
   end
 
+  local entry = data[root].build_targets[scope]
+  if type(entry) == "table" and entry.value == value and entry.signature == signature then
+    return
+  end
+
   data[root].build_targets[scope] = {
     value = value,
     signature = signature,